@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+from bo_core import complete_regression_cv_job
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Complete a deferred regression CV diagnostic and fill it into the hybrid debug JSON."
+    )
+    parser.add_argument("job_path", type=Path, help="Job file written by a --defer-regression-cv round run")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Run the (fold, model family) fits on this many worker processes.",
+    )
+    args = parser.parse_args()
+    complete_regression_cv_job(args.job_path, workers=args.workers)
+
+
+if __name__ == "__main__":
+    main()
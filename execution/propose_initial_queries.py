@@ -7,6 +7,7 @@ from typing import Dict, Tuple
 
 import numpy as np
 
+from bo_core import NearestObservationIndex
 from data_loader import DEFAULT_DATA_ROOT, iter_functions
 
 
@@ -31,8 +32,7 @@ def propose_candidate(
     lhs_candidates = latin_hypercube(num_lhs, d, rng)
     candidates = np.vstack([random_candidates, lhs_candidates])
 
-    dists = np.linalg.norm(candidates[:, None, :] - x[None, :, :], axis=-1)
-    min_dist = np.min(dists, axis=1)
+    min_dist = NearestObservationIndex(x).min_distance(candidates)
     best_idx = int(np.argmax(min_dist))
     candidate = candidates[best_idx]
     return np.clip(candidate, 0.0, 0.999999)
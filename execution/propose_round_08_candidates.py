@@ -2,18 +2,11 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict
 
 import numpy as np
 
-from bo_core import (
-    append_round_to_initial_data,
-    build_round_candidate_parser,
-    choose_hybrid_candidate,
-    parse_latest_round,
-    save_round_outputs_snapshot,
-    write_submission_outputs,
-)
+from bo_core import build_round_candidate_parser, run_round_candidate_script
 
 
 def _maybe_apply_f5_corner_override(
@@ -25,7 +18,8 @@ def _maybe_apply_f5_corner_override(
     low: float,
     high: float,
 ) -> np.ndarray:
-    if func_id != 5:
+    # The corner override is a single manual pick; later batch picks are already conditioned on it.
+    if func_id != 5 or info.get("batch_index", 0) > 0:
         return candidate
 
     top_idx = np.argsort(y)[::-1][:2]
@@ -63,75 +57,10 @@ def main() -> None:
     )
     parser.set_defaults(strategy="exploit", kappa=1.25, z_best_threshold=1.65, boundary_margin=0.03)
     args = parser.parse_args()
-
-    parsed = parse_latest_round(args.inputs_path, args.outputs_path, args.round_index)
-    if args.skip_ingest:
-        ingest_summary = {"skipped": True}
-    else:
-        ingest_summary = append_round_to_initial_data(
-            data_root=args.data_root,
-            round_inputs=parsed.round_inputs,
-            round_outputs=parsed.round_outputs,
-        )
-        save_round_outputs_snapshot(parsed.round_outputs, args.out_dir, "round_07_outputs_canonical.txt")
-
-    rng = np.random.default_rng(args.seed)
-    raw_vectors: Dict[str, List[float]] = {}
-    portal_strings: Dict[str, str] = {}
-    debug_info: Dict[str, Dict[str, Any]] = {
-        "_ingest_summary": ingest_summary,
-        "_config": {
-            "seed": args.seed,
-            "low": args.low,
-            "high": args.high,
-            "boundary_margin": args.boundary_margin,
-            "round_index": args.round_index,
-            "inputs_path": str(args.inputs_path),
-            "outputs_path": str(args.outputs_path),
-            "strategy": args.strategy,
-            "kappa": args.kappa,
-            "z_best_threshold": args.z_best_threshold,
-            "prefix": args.prefix,
-            "skip_ingest": bool(args.skip_ingest),
-        },
-    }
-
-    for func_id in range(1, 9):
-        func_key = f"function_{func_id}"
-        x = np.load(args.data_root / func_key / "initial_inputs.npy")
-        y = np.load(args.data_root / func_key / "initial_outputs.npy").reshape(-1)
-        candidate, info = choose_hybrid_candidate(
-            x=x,
-            y=y,
-            rng=rng,
-            low=args.low,
-            high=args.high,
-            boundary_margin=args.boundary_margin,
-            seed=args.seed + func_id * 13,
-            strategy=args.strategy,
-            kappa=args.kappa,
-            z_best_threshold=args.z_best_threshold,
-        )
-        candidate = _maybe_apply_f5_corner_override(
-            func_id=func_id,
-            x=x,
-            y=y,
-            candidate=np.asarray(candidate, dtype=float),
-            info=info,
-            low=args.low,
-            high=args.high,
-        )
-        raw_vectors[func_key] = [float(v) for v in np.asarray(candidate, dtype=float).tolist()]
-        portal_strings[func_key] = "-".join(f"{float(v):.6f}" for v in np.asarray(candidate, dtype=float))
-        debug_info[func_key] = info
-
-    write_submission_outputs(
-        args.out_dir,
-        raw_vectors,
-        portal_strings,
-        debug_info,
-        prefix=args.prefix,
-        debug_label="hybrid_debug",
+    run_round_candidate_script(
+        args,
+        snapshot_filename="round_07_outputs_canonical.txt",
+        candidate_hook=_maybe_apply_f5_corner_override,
     )
 
 
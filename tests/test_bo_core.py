@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 import math
 import sys
 import tempfile
@@ -57,6 +58,642 @@ class TestBayesianOptimizationCore(unittest.TestCase):
         self.assertIsInstance(info["length_scale_at_upper_bound"], bool)
         self.assertLess(sum(np.isclose(info["best_length_scales"], bo_core.LENGTH_SCALE_BOUNDS[0], atol=1e-4)), 3)
 
+    def test_closed_form_loo_matches_explicit_holdout(self) -> None:
+        rng = np.random.default_rng(5)
+        x = rng.random((10, 3))
+        y = np.sin(3.0 * x[:, 0]) + x[:, 1] ** 2 - 0.5 * x[:, 2]
+
+        gp, info = bo_core.fit_gp_model(x, y, random_state=3, n_restarts_optimizer=1)
+
+        y_mean = float(np.mean(y))
+        y_scale = float(np.std(y))
+        y_norm = (y - y_mean) / y_scale
+        k_full = gp.kernel_(x) + gp.alpha * np.eye(len(y))
+        preds = np.zeros(len(y))
+        for idx in range(len(y)):
+            keep = np.arange(len(y)) != idx
+            weights = np.linalg.solve(k_full[np.ix_(keep, keep)], k_full[keep, idx])
+            preds[idx] = y_mean + y_scale * float(weights @ y_norm[keep])
+
+        self.assertAlmostEqual(info["loo_mae"], float(np.mean(np.abs(y - preds))), places=8)
+        self.assertAlmostEqual(info["loo_rmse"], float(np.sqrt(np.mean((y - preds) ** 2))), places=8)
+        self.assertEqual(len(info["loo_standardized_residuals"]), len(y))
+        self.assertTrue(math.isfinite(info["loo_log_predictive"]))
+
+    def test_parallel_seeded_restarts_match_serial_fit(self) -> None:
+        rng = np.random.default_rng(11)
+        x = rng.random((12, 3))
+        y = np.cos(4.0 * x[:, 0]) + x[:, 1] * x[:, 2]
+
+        serial_gp, serial_info = bo_core.fit_gp_model(x, y, random_state=42, n_restarts_optimizer=3, restart_workers=1)
+        parallel_gp, parallel_info = bo_core.fit_gp_model(x, y, random_state=42, n_restarts_optimizer=3, restart_workers=2)
+
+        self.assertEqual(serial_info["gp_restart_mode"], "seeded")
+        self.assertEqual(len(serial_info["gp_restart_log_marginal_likelihoods"]), 4)
+        self.assertEqual(serial_info["gp_restart_best_index"], parallel_info["gp_restart_best_index"])
+        np.testing.assert_array_equal(serial_gp.kernel_.theta, parallel_gp.kernel_.theta)
+        np.testing.assert_array_equal(serial_gp.alpha_, parallel_gp.alpha_)
+        self.assertEqual(
+            serial_info["gp_log_marginal_likelihood"],
+            max(serial_info["gp_restart_log_marginal_likelihoods"]),
+        )
+
+    def test_warm_start_reuses_stored_hyperparameters_and_falls_back(self) -> None:
+        rng = np.random.default_rng(17)
+        x = rng.random((14, 2))
+        y = np.sin(5.0 * x[:, 0]) * np.cos(3.0 * x[:, 1])
+
+        _, cold_info = bo_core.fit_gp_model(x[:-1], y[:-1], random_state=4, n_restarts_optimizer=4)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            bo_core.save_gp_warm_start(Path(tmp_dir), cold_info)
+            warm_start = bo_core.load_gp_warm_start(Path(tmp_dir))
+
+        _, warm_info = bo_core.fit_gp_model(x, y, random_state=4, n_restarts_optimizer=4, warm_start=warm_start)
+        self.assertTrue(warm_info["gp_warm_start_used"])
+        self.assertFalse(warm_info["gp_warm_start_fallback"])
+        self.assertEqual(warm_info["n_optimizer_restarts"], bo_core.WARM_START_RESTARTS)
+
+        unreachable = dict(warm_start, log_marginal_likelihood_per_sample=1e6)
+        _, fallback_info = bo_core.fit_gp_model(x, y, random_state=4, n_restarts_optimizer=4, warm_start=unreachable)
+        self.assertTrue(fallback_info["gp_warm_start_fallback"])
+        self.assertGreaterEqual(
+            fallback_info["gp_log_marginal_likelihood"],
+            warm_info["gp_log_marginal_likelihood"] - 1e-6,
+        )
+
+    def test_gp_state_append_matches_full_factorisation(self) -> None:
+        rng = np.random.default_rng(23)
+        x = rng.random((11, 3))
+        y = np.sin(2.0 * x[:, 0]) + x[:, 1] - x[:, 2] ** 2
+
+        gp, info = bo_core.fit_gp_model(x[:-1], y[:-1], random_state=8, n_restarts_optimizer=1)
+        state = bo_core.GPState.from_gp(gp)
+        probe = rng.random((6, 3))
+        mu_state, sigma_state = state.predict(probe, return_std=True)
+        mu_gp, sigma_gp = gp.predict(probe, return_std=True)
+        np.testing.assert_allclose(mu_state, mu_gp, atol=1e-8)
+        np.testing.assert_allclose(sigma_state, sigma_gp, atol=1e-8)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / bo_core.GP_STATE_FILENAME
+            state.save(path)
+            state = bo_core.GPState.load(path)
+        state.append(x[-1], y[-1])
+        full = bo_core.GPState.from_hyperparameters(x, y, info["gp_kernel_theta"])
+
+        self.assertEqual(state.x.shape, (11, 3))
+        np.testing.assert_allclose(state.chol, full.chol, atol=1e-10)
+        fantasy = state.fantasize(probe[0], 0.0)
+        self.assertEqual(fantasy.x.shape[0], 12)
+        self.assertEqual(state.x.shape[0], 11)
+
+        self.assertTrue(state.matches(x, y))
+        self.assertFalse(state.matches(x[::-1], y[::-1]))
+        reused_gp, reused_info = bo_core.fit_gp_model(x, y, random_state=8, n_restarts_optimizer=1, gp_state=state)
+        self.assertTrue(reused_info["gp_state_reused"])
+        self.assertEqual(reused_info["n_optimizer_restarts"], 0)
+        np.testing.assert_allclose(reused_gp.predict(probe), state.predict(probe), atol=1e-10)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            bo_core.save_gp_state(Path(tmp_dir), x, y, reused_info)
+            self.assertFalse((Path(tmp_dir) / bo_core.GP_STATE_FILENAME).exists())
+
+        fixed = bo_core._fit_gp_with_fixed_kernel(x, y, gp.kernel_)
+        self.assertAlmostEqual(
+            full.to_gp().log_marginal_likelihood_value_,
+            float(fixed.log_marginal_likelihood_value_),
+            places=6,
+        )
+
+    def test_trust_region_state_updates_at_ingest(self) -> None:
+        rng = np.random.default_rng(67)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            data_root = Path(tmp_dir)
+            dims = [2, 2, 3, 4, 4, 5, 6, 8]
+            for func_id, dim in enumerate(dims, start=1):
+                func_dir = data_root / f"function_{func_id}"
+                func_dir.mkdir()
+                np.save(func_dir / "initial_inputs.npy", rng.random((10, dim)))
+                np.save(func_dir / "initial_outputs.npy", rng.random(10))
+            func_dir = data_root / "function_8"
+            x = np.load(func_dir / "initial_inputs.npy")
+            y = np.load(func_dir / "initial_outputs.npy")
+            region = bo_core.load_trust_region(func_dir, x, y)
+            region.set_length_scales(np.linspace(0.1, 0.8, 8))
+            bo_core.save_trust_region(func_dir, region)
+
+            for round_id in range(8):
+                summary = bo_core.append_round_to_initial_data(
+                    data_root,
+                    [rng.random(dim) for dim in dims],
+                    [-1.0 - round_id] * 8,
+                )
+                self.assertTrue(summary["function_8"]["trust_region_updated"])
+                self.assertFalse(summary["function_1"]["trust_region_updated"])
+
+            region = bo_core.TrustRegionState.load(func_dir / bo_core.TRUST_REGION_FILENAME)
+            self.assertAlmostEqual(region.length, bo_core.TRUST_REGION_LENGTH_INIT / 2.0)
+            self.assertEqual(region.n_observations, 18)
+            self.assertAlmostEqual(float(np.exp(np.mean(np.log(region.side_lengths)))), region.length)
+            np.testing.assert_allclose(region.center, x[int(np.argmax(y))])
+
+            region_low, region_high = region.bounds(bo_core.DEFAULT_LOW, bo_core.DEFAULT_HIGH)
+            parts = bo_core._hybrid_pool_parts(
+                x,
+                y,
+                np.array([], dtype=int),
+                bo_core.DEFAULT_LOW,
+                bo_core.DEFAULT_HIGH,
+                "balanced",
+                region=(region_low, region_high),
+            )
+            global_samples = np.vstack(list(bo_core._iter_pool_chunks(rng, parts[:1])))
+            self.assertLess(len(global_samples), 12000)
+            self.assertTrue(np.all((global_samples >= region_low) & (global_samples <= region_high)))
+
+    def test_surrogate_cache_reuses_fits_and_evicts_least_recent(self) -> None:
+        rng = np.random.default_rng(31)
+        x = rng.random((9, 2))
+        y = x[:, 0] - x[:, 1]
+        calls: list[int] = []
+
+        def compute() -> np.ndarray:
+            calls.append(1)
+            return np.full(4096, float(len(calls)))
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cache = bo_core.SurrogateCache(Path(tmp_dir), max_bytes=50_000)
+            first = cache.get_or_compute("demo", x, y, 1, {"alpha": 1}, compute)
+            again = cache.get_or_compute("demo", x, y, 1, {"alpha": 1}, compute)
+            np.testing.assert_array_equal(first, again)
+            self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+            cache.get_or_compute("demo", x, y, 2, {"alpha": 1}, compute)
+            self.assertEqual(len(calls), 2)
+            self.assertEqual(len(list(Path(tmp_dir).glob("*.pkl"))), 1)
+
+            cache.get_or_compute("demo", x, y, 2, {"alpha": 1}, compute)
+            self.assertEqual(len(calls), 2)
+
+    def test_native_posterior_matches_sklearn_and_finite_differences(self) -> None:
+        rng = np.random.default_rng(37)
+        x = rng.random((18, 4))
+        y = np.sin(3.0 * x[:, 0]) + x[:, 1] * x[:, 2] - x[:, 3]
+        gp, _ = bo_core.fit_gp_model(x, y, random_state=2, n_restarts_optimizer=1)
+        posterior = bo_core.GPPosterior.from_gp(gp, chunk_size=64)
+
+        probe = np.vstack([x[:2], rng.random((300, 4))])
+        mu_ref, sigma_ref = gp.predict(probe, return_std=True)
+        mu, sigma = posterior.mean_and_std(probe)
+        np.testing.assert_allclose(mu, mu_ref, rtol=0.0, atol=1e-10)
+        np.testing.assert_allclose(sigma, sigma_ref, rtol=0.0, atol=1e-10)
+        np.testing.assert_allclose(posterior.mean(probe), mu_ref, rtol=0.0, atol=1e-10)
+
+        step = 1e-6
+        _, grad = posterior.mean_and_grad(probe[:5])
+        for dim_idx in range(4):
+            offset = np.zeros(4)
+            offset[dim_idx] = step
+            finite = (posterior.mean(probe[:5] + offset) - posterior.mean(probe[:5] - offset)) / (2.0 * step)
+            np.testing.assert_allclose(grad[:, dim_idx], finite, rtol=1e-5, atol=1e-6)
+
+    def test_lbfgs_refiner_uses_analytic_acquisition_gradients(self) -> None:
+        rng = np.random.default_rng(41)
+        x = rng.random((15, 3))
+        y = np.sin(3.0 * x.sum(axis=1))
+        gp, _ = bo_core.fit_gp_model(x, y, random_state=6, n_restarts_optimizer=1)
+        posterior = bo_core.GPPosterior.from_gp(gp)
+
+        probe = rng.random((4, 3))
+        step = 1e-6
+        for acquisition in ("ei", "ucb"):
+            acq = bo_core._GPAcquisition(posterior, acquisition=acquisition, best_y=float(np.max(y)) - 0.2, xi=0.01, kappa=2.0)
+            _, grad = acq.value_and_grad(probe)
+            for dim_idx in range(3):
+                offset = np.zeros(3)
+                offset[dim_idx] = step
+                finite = (acq(probe + offset) - acq(probe - offset)) / (2.0 * step)
+                np.testing.assert_allclose(grad[:, dim_idx], finite, rtol=1e-4, atol=1e-6)
+
+        candidate, info = bo_core.choose_gp_candidate(
+            x=x,
+            y=y,
+            rng=np.random.default_rng(3),
+            low=bo_core.DEFAULT_LOW,
+            high=bo_core.DEFAULT_HIGH,
+            boundary_margin=0.05,
+            z_best_threshold=2.5,
+            kappa=1.96,
+            gp_restarts=1,
+            refiner="lbfgs",
+        )
+        self.assertEqual(info["refiner"], "lbfgs")
+        self.assertGreater(info["refine_acquisition_evaluations"], 0)
+        self.assertIn("refine_cpu_seconds", info["_timings"])
+        self.assertTrue(np.all((candidate >= bo_core.DEFAULT_LOW) & (candidate <= bo_core.DEFAULT_HIGH)))
+        self.assertFalse(info["chosen_candidate_matches_existing_portal"])
+
+    def test_batched_refiner_scores_each_iteration_in_one_call(self) -> None:
+        rng = np.random.default_rng(47)
+        x = rng.random((20, 4))
+        target = np.full(4, 0.6)
+        calls = []
+
+        def score_batch(points: np.ndarray) -> np.ndarray:
+            calls.append(len(points))
+            return -np.sum((points - target) ** 2, axis=1)
+
+        start_points = rng.random((15, 4))
+        refined = bo_core._refine_candidates_batched(
+            np.random.default_rng(5),
+            x,
+            start_points,
+            score_batch,
+            bo_core.DEFAULT_LOW,
+            bo_core.DEFAULT_HIGH,
+            strategy="balanced",
+            novelty_floor=0.0,
+            existing_portal_keys=bo_core.PortalKeyIndex(x),
+        )
+
+        self.assertEqual(calls[0], 15)
+        self.assertLessEqual(len(calls), 9)
+        best_start = float(np.max(score_batch(start_points)))
+        self.assertGreater(max(score for _, score in refined), best_start)
+
+        candidate, info = bo_core.choose_hybrid_candidate(
+            x=x,
+            y=np.sin(3.0 * x.sum(axis=1)),
+            rng=np.random.default_rng(3),
+            low=bo_core.DEFAULT_LOW,
+            high=bo_core.DEFAULT_HIGH,
+            boundary_margin=0.035,
+            seed=11,
+            strategy="balanced",
+            kappa=1.96,
+            gp_restarts=1,
+            refiner="batched",
+        )
+        self.assertEqual(info["refiner"], "batched")
+        self.assertLessEqual(info["refine_score_batches"], 9)
+        self.assertEqual(candidate.shape[0], 4)
+
+    def test_cmaes_refiner_respects_evaluation_budget(self) -> None:
+        rng = np.random.default_rng(53)
+        x = rng.random((20, 4))
+        target = np.full(4, 0.3)
+        calls = []
+
+        def score_batch(points: np.ndarray) -> np.ndarray:
+            calls.append(len(points))
+            return -np.sum((points - target) ** 2, axis=1)
+
+        start_points = rng.random((3, 4))
+        refined = bo_core._refine_candidates_cmaes(
+            np.random.default_rng(5),
+            x,
+            start_points,
+            score_batch,
+            bo_core.DEFAULT_LOW,
+            bo_core.DEFAULT_HIGH,
+            strategy="balanced",
+            novelty_floor=0.0,
+            existing_portal_keys=bo_core.PortalKeyIndex(x),
+            budget=600,
+        )
+
+        self.assertLessEqual(sum(calls), 600)
+        self.assertEqual(len(set(calls)), 1)
+        best = max(refined, key=lambda item: item[1])
+        self.assertLess(float(np.linalg.norm(best[0] - target)), 0.05)
+
+        candidate, info = bo_core.choose_hybrid_candidate(
+            x=x,
+            y=np.sin(3.0 * x.sum(axis=1)),
+            rng=np.random.default_rng(3),
+            low=bo_core.DEFAULT_LOW,
+            high=bo_core.DEFAULT_HIGH,
+            boundary_margin=0.035,
+            seed=11,
+            strategy="balanced",
+            kappa=1.96,
+            gp_restarts=1,
+            refiner="cmaes",
+            refine_budget=800,
+        )
+        self.assertEqual(info["refiner"], "cmaes")
+        self.assertEqual(info["refine_budget"], 800)
+        self.assertLessEqual(info["refine_score_evaluations"], 800)
+        self.assertGreater(info["refine_score_evaluations"], 0)
+        self.assertIn("refine_wall_seconds", info["_timings"])
+        self.assertEqual(candidate.shape[0], 4)
+
+    def test_rff_thompson_samples_track_posterior(self) -> None:
+        from sklearn.gaussian_process import GaussianProcessRegressor
+        from sklearn.gaussian_process.kernels import ConstantKernel, Matern, WhiteKernel
+
+        rng = np.random.default_rng(71)
+        x = rng.random((40, 2))
+        y = np.sin(6.0 * x.sum(axis=1))
+        kernel = ConstantKernel(1.0, "fixed") * Matern([0.3, 0.3], length_scale_bounds="fixed", nu=2.5) + WhiteKernel(
+            0.01, "fixed"
+        )
+        gp = GaussianProcessRegressor(kernel, normalize_y=True, optimizer=None).fit(x, y)
+        posterior = bo_core.GPPosterior.from_gp(gp)
+        probe = rng.random((50, 2))
+
+        samples = np.array(
+            [bo_core.RFFThompsonSample.from_posterior(posterior, x, y, seed=s, n_features=512)(probe) for s in range(60)]
+        )
+        np.testing.assert_allclose(samples.mean(axis=0), posterior.mean(probe), atol=0.15)
+
+        sample = bo_core.RFFThompsonSample.from_posterior(posterior, x, y, seed=5)
+        _, grad = sample.value_and_grad(probe[:4])
+        step = 1e-6
+        for dim_idx in range(2):
+            offset = np.zeros(2)
+            offset[dim_idx] = step
+            finite = (sample(probe[:4] + offset) - sample(probe[:4] - offset)) / (2.0 * step)
+            np.testing.assert_allclose(grad[:, dim_idx], finite, rtol=1e-4, atol=1e-6)
+
+        candidate, info = bo_core.choose_hybrid_candidate(
+            x=x,
+            y=y,
+            rng=np.random.default_rng(2),
+            low=bo_core.DEFAULT_LOW,
+            high=bo_core.DEFAULT_HIGH,
+            boundary_margin=0.035,
+            seed=40,
+            strategy="balanced",
+            kappa=1.96,
+            gp_restarts=1,
+            refiner="lbfgs",
+            acquisition_mode="thompson",
+        )
+        self.assertEqual(info["acquisition"], "thompson")
+        self.assertEqual(info["thompson_sample_seed"], 40 + 300 + 2)
+        self.assertTrue(math.isfinite(info["chosen_candidate_thompson_value"]))
+        self.assertEqual(candidate.shape[0], 2)
+
+    def test_smoothness_metrics_match_finite_difference_gradients(self) -> None:
+        rng = np.random.default_rng(43)
+        x = rng.random((16, 2))
+        y = np.sin(4.0 * x[:, 0]) + 0.3 * x[:, 1]
+        gp, info = bo_core.fit_gp_model(x, y, random_state=1, n_restarts_optimizer=1)
+        self.assertEqual(info["smoothness_probe_count"], bo_core.SMOOTHNESS_PROBE_COUNT)
+
+        metrics = bo_core._gp_smoothness_metrics(gp, 2, probe_count=64)
+        margin = metrics["smoothness_probe_margin"]
+        interior_low = bo_core.DEFAULT_LOW + margin
+        interior_high = bo_core.DEFAULT_HIGH - margin
+        base = interior_low + (interior_high - interior_low) * np.random.default_rng(0).random((64, 2))
+        finite = np.zeros_like(base)
+        for dim_idx in range(2):
+            offset = np.zeros(2)
+            offset[dim_idx] = 1e-6
+            finite[:, dim_idx] = np.abs(gp.predict(base + offset) - gp.predict(base - offset)) / 2e-6
+
+        np.testing.assert_allclose(metrics["gp_dim_abs_gradient_median"], np.median(finite, axis=0), rtol=1e-4)
+        self.assertAlmostEqual(metrics["gp_abs_gradient_p95"], float(np.quantile(finite, 0.95)), delta=1e-4 * metrics["gp_abs_gradient_p95"])
+
+    def test_sparse_gp_mode_switches_above_threshold(self) -> None:
+        rng = np.random.default_rng(47)
+        x = rng.random((80, 2))
+        y = np.sin(3.0 * x[:, 0]) + x[:, 1] ** 2
+
+        exact_gp, exact_info = bo_core.fit_gp_model(x, y, random_state=5, n_restarts_optimizer=1)
+        self.assertEqual(exact_info["gp_mode"], "exact")
+
+        sparse_model, sparse_info = bo_core.fit_gp_model(
+            x,
+            y,
+            random_state=5,
+            n_restarts_optimizer=1,
+            sparse_threshold=50,
+            n_inducing=30,
+        )
+        self.assertEqual(sparse_info["gp_mode"], "sparse_fitc")
+        self.assertEqual(sparse_info["n_inducing_points"], 30)
+        self.assertEqual(sparse_info["loo_scope"], "inducing_subset")
+        self.assertTrue(math.isfinite(sparse_info["gp_abs_gradient_p95"]))
+
+        probe = rng.random((200, 2))
+        mu, sigma = sparse_model.predict(probe, return_std=True)
+        self.assertTrue(np.all(sigma >= 0.0))
+        self.assertLess(float(np.sqrt(np.mean((mu - exact_gp.predict(probe)) ** 2))), 0.05 * float(np.std(y)))
+
+        candidate, info = bo_core.choose_gp_candidate(
+            x=x,
+            y=y,
+            rng=np.random.default_rng(9),
+            low=bo_core.DEFAULT_LOW,
+            high=bo_core.DEFAULT_HIGH,
+            boundary_margin=0.05,
+            z_best_threshold=2.5,
+            kappa=1.96,
+            gp_restarts=1,
+            sparse_threshold=50,
+            n_inducing=30,
+        )
+        self.assertEqual(info["gp_mode"], "sparse_fitc")
+        self.assertEqual(candidate.shape, (2,))
+
+    def test_portal_key_index_matches_string_keys(self) -> None:
+        rng = np.random.default_rng(53)
+        x = np.round(rng.random((25, 4)), bo_core.PORTAL_DECIMALS)
+        candidates = rng.random((500, 4))
+        candidates[:6] = x[:6]
+        candidates[6] = x[7] + 3e-7
+        candidates[7] = x[8] + 2e-6
+
+        index = bo_core.PortalKeyIndex(x)
+        string_keys = {bo_core._portal_key(row) for row in x}
+        expected = np.array([bo_core._portal_key(row) in string_keys for row in candidates], dtype=bool)
+
+        np.testing.assert_array_equal(index.contains(candidates), expected)
+        self.assertTrue(candidates[6] in index)
+        self.assertFalse(candidates[7] in index)
+
+        seen = index.copy()
+        seen.add(candidates[7])
+        self.assertTrue(bool(seen.contains(candidates[7:8])[0]))
+        self.assertFalse(candidates[7] in index)
+
+    def test_nearest_observation_index_matches_brute_force(self) -> None:
+        rng = np.random.default_rng(59)
+        x = rng.random((40, 6))
+        queries = rng.random((300, 6))
+        brute = np.min(np.linalg.norm(queries[:, None, :] - x[None, :, :], axis=2), axis=1)
+
+        index = bo_core.NearestObservationIndex(x, chunk_size=64)
+        np.testing.assert_allclose(index.min_distance(queries), brute, atol=1e-12)
+        self.assertAlmostEqual(index.nearest_distance(queries[3]), float(brute[3]), places=12)
+
+    def test_hybrid_total_scores_vectorized(self) -> None:
+        rng = np.random.default_rng(61)
+        gp, nn, cls, novelty, boundary = rng.random((5, 40))
+        stats = bo_core._hybrid_score_components(gp, nn, cls, novelty)
+        weights = bo_core.HYBRID_WEIGHTS["balanced"]
+
+        scores = bo_core._hybrid_total_scores(gp, nn, cls, novelty, boundary, stats, weights)
+        i = 7
+        expected = boundary[i] * (
+            weights["gp"] * (gp[i] - stats.gp_mean) / stats.gp_std
+            + weights["nn"] * (nn[i] - stats.nn_mean) / stats.nn_std
+            + weights["classification"] * (cls[i] - stats.cls_mean) / stats.cls_std
+            + weights["novelty"] * (novelty[i] - stats.novelty_mean) / stats.novelty_std
+        )
+        self.assertEqual(scores.shape, (40,))
+        self.assertAlmostEqual(float(scores[i]), float(expected), places=12)
+
+    def test_qmc_pool_uses_cached_base_sequence(self) -> None:
+        from scipy.stats import qmc
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cache_dir = Path(tmp_dir)
+            first = bo_core._global_pool_samples(
+                np.random.default_rng(1), 2000, 5, 0.0, 1.0, sampler="sobol", qmc_cache_dir=cache_dir
+            )
+            second = bo_core._global_pool_samples(
+                np.random.default_rng(2), 2000, 5, 0.0, 1.0, sampler="sobol", qmc_cache_dir=cache_dir
+            )
+            self.assertEqual(len(list(cache_dir.glob("sobol_d5_*.npy"))), 1)
+            self.assertEqual(first.shape, (1000, 5))
+            self.assertFalse(np.allclose(first, second))
+
+            uniform = np.random.default_rng(1).random((1000, 5))
+            self.assertLess(qmc.discrepancy(first), qmc.discrepancy(uniform))
+
+            halton = bo_core._global_pool_samples(
+                np.random.default_rng(3), 400, 3, 0.1, 0.9, sampler="halton", qmc_cache_dir=cache_dir
+            )
+            self.assertTrue(np.all((halton >= 0.1) & (halton <= 0.9)))
+
+    def test_mean_screening_scores_a_fraction_of_the_pool(self) -> None:
+        x = np.load(REPO_ROOT / "initial_data" / "function_4" / "initial_inputs.npy")
+        y = np.load(REPO_ROOT / "initial_data" / "function_4" / "initial_outputs.npy").reshape(-1)
+        common = dict(
+            x=x,
+            y=y,
+            low=bo_core.DEFAULT_LOW,
+            high=bo_core.DEFAULT_HIGH,
+            boundary_margin=0.035,
+            seed=17,
+            kappa=1.96,
+            gp_restarts=1,
+            screen_fraction=0.2,
+        )
+
+        candidate, info = bo_core.choose_hybrid_candidate(rng=np.random.default_rng(4), strategy="balanced", **common)
+        self.assertTrue(info["pool_screening_applied"])
+        self.assertAlmostEqual(info["pool_fraction_scored"], 0.2 + bo_core.SCREEN_RANDOM_FRACTION, places=2)
+        self.assertEqual(candidate.shape[0], x.shape[1])
+
+        _, explore_info = bo_core.choose_hybrid_candidate(rng=np.random.default_rng(4), strategy="explore", **common)
+        self.assertFalse(explore_info["pool_screening_applied"])
+        self.assertEqual(explore_info["pool_fraction_scored"], 1.0)
+
+        mu = np.linspace(0.0, 1.0, 200)
+        kept = bo_core._screen_pool_by_mean(mu, 0.1, seed=3)
+        np.testing.assert_array_equal(kept, bo_core._screen_pool_by_mean(mu, 0.1, seed=3))
+        self.assertTrue(set(range(180, 200)).issubset(set(kept.tolist())))
+
+    def test_streamed_pool_matches_single_pass(self) -> None:
+        for func_id, strategy, screen_fraction in ((3, "balanced", None), (3, "explore", None), (7, "balanced", 0.1)):
+            x = np.load(REPO_ROOT / "initial_data" / f"function_{func_id}" / "initial_inputs.npy")
+            y = np.load(REPO_ROOT / "initial_data" / f"function_{func_id}" / "initial_outputs.npy").reshape(-1)
+            results = []
+            for chunk_size in (None, 1500):
+                rng = np.random.default_rng(21)
+                candidate, info = bo_core.choose_hybrid_candidate(
+                    x=x,
+                    y=y,
+                    rng=rng,
+                    low=bo_core.DEFAULT_LOW,
+                    high=bo_core.DEFAULT_HIGH,
+                    boundary_margin=0.035,
+                    seed=21,
+                    strategy=strategy,
+                    kappa=1.96,
+                    gp_restarts=1,
+                    pool_chunk_size=chunk_size,
+                    screen_fraction=screen_fraction,
+                )
+                results.append((candidate, info, rng.random()))
+
+            (single, single_info, single_next), (streamed, streamed_info, streamed_next) = results
+            np.testing.assert_allclose(streamed, single)
+            self.assertEqual(streamed_info["candidate_pool_size"], single_info["candidate_pool_size"])
+            self.assertEqual(streamed_info["pool_fraction_scored"], single_info["pool_fraction_scored"])
+            self.assertGreater(streamed_info["pool_chunks"], 1)
+            self.assertEqual(streamed_next, single_next)
+
+    def test_batch_proposals_use_fantasized_observations(self) -> None:
+        x = np.load(REPO_ROOT / "initial_data" / "function_2" / "initial_inputs.npy")
+        y = np.load(REPO_ROOT / "initial_data" / "function_2" / "initial_outputs.npy").reshape(-1)
+
+        batch, infos = bo_core.propose_hybrid_batch(
+            x,
+            y,
+            np.random.default_rng(8),
+            batch_size=3,
+            low=bo_core.DEFAULT_LOW,
+            high=bo_core.DEFAULT_HIGH,
+            boundary_margin=0.035,
+            seed=8,
+            strategy="balanced",
+            kappa=1.96,
+            gp_restarts=1,
+        )
+
+        self.assertEqual(batch.shape, (3, x.shape[1]))
+        self.assertEqual(len({bo_core._portal_key(row) for row in batch}), 3)
+        self.assertEqual([info["batch_index"] for info in infos], [0, 1, 2])
+        self.assertTrue(all(info["batch_fantasy"] == "kriging_believer" for info in infos))
+
+        override = np.full(x.shape[1], 0.5)
+
+        def hook(candidate: np.ndarray, info: dict) -> np.ndarray:
+            return override if info["batch_index"] == 0 else candidate
+
+        hooked, hooked_infos = bo_core.propose_hybrid_batch(
+            x,
+            y,
+            np.random.default_rng(8),
+            batch_size=3,
+            low=bo_core.DEFAULT_LOW,
+            high=bo_core.DEFAULT_HIGH,
+            boundary_margin=0.035,
+            seed=8,
+            strategy="balanced",
+            kappa=1.96,
+            gp_restarts=1,
+            candidate_hook=hook,
+        )
+        np.testing.assert_allclose(hooked[0], override)
+        self.assertEqual([info["batch_hook_replaced"] for info in hooked_infos], [True, False, False])
+        self.assertEqual(hooked_infos[0]["batch_candidate"], override.tolist())
+        self.assertNotIn(bo_core._portal_key(override), {bo_core._portal_key(row) for row in hooked[1:]})
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            out_dir = Path(tmp_dir)
+            rows = [[0.1 + 0.1 * j] * (2 if i <= 2 else 3 if i == 3 else 4 if i <= 5 else 5 if i == 6 else 6 if i == 7 else 8) for j in range(3) for i in range(1, 9)]
+            batch_vectors = {f"function_{i}": [rows[8 * j + i - 1] for j in range(3)] for i in range(1, 9)}
+            raw_vectors = {key: value[0] for key, value in batch_vectors.items()}
+            portal_strings = {key: bo_core._portal_key(np.array(value)) for key, value in raw_vectors.items()}
+            bo_core.write_submission_outputs(
+                out_dir,
+                raw_vectors,
+                portal_strings,
+                {},
+                prefix="batch_round",
+                debug_label="hybrid_debug",
+                batch_vectors=batch_vectors,
+            )
+
+            parsed = bo_core.parse_batch_file(out_dir / "batch_round_inputs.txt")
+            self.assertEqual(len(parsed), 3)
+            self.assertAlmostEqual(float(parsed[2][7][0]), 0.3)
+
     def test_balanced_mode_avoids_exact_boundary_candidates(self) -> None:
         x = np.load(REPO_ROOT / "initial_data" / "function_5" / "initial_inputs.npy")
         y = np.load(REPO_ROOT / "initial_data" / "function_5" / "initial_outputs.npy").reshape(-1)
@@ -78,13 +715,15 @@ class TestBayesianOptimizationCore(unittest.TestCase):
         self.assertTrue(
             float(info["chosen_candidate_bound_dist"]) > 0.0 or bool(info["boundary_override_used"])
         )
+        self.assertGreater(info["aux_rows_skipped"], 0)
+        self.assertLessEqual(info["aux_rows_scored"], bo_core.SHORTLIST_SIZE_BY_STRATEGY["balanced"])
 
     def test_write_outputs_uses_prefix_naming(self) -> None:
         with tempfile.TemporaryDirectory() as tmp_dir:
             out_dir = Path(tmp_dir)
             raw_vectors = {f"function_{i}": [0.1] * (2 if i <= 2 else 3 if i == 3 else 4 if i <= 5 else 5 if i == 6 else 6 if i == 7 else 8) for i in range(1, 9)}
             portal_strings = {key: "-".join(f"{v:.6f}" for v in value) for key, value in raw_vectors.items()}
-            debug_info = {"function_1": {"objective_direction": "maximize"}}
+            debug_info = {"function_1": {"objective_direction": "maximize", "_timings": {"refine_cpu_seconds": 0.1}}}
 
             bo_core.write_submission_outputs(
                 out_dir,
@@ -99,6 +738,205 @@ class TestBayesianOptimizationCore(unittest.TestCase):
             self.assertTrue((out_dir / "demo_round_portal_strings.json").exists())
             self.assertTrue((out_dir / "demo_round_inputs.txt").exists())
             self.assertTrue((out_dir / "demo_round_hybrid_debug.json").exists())
+            self.assertTrue((out_dir / "demo_round_hybrid_debug_timings.json").exists())
+            self.assertNotIn("_timings", (out_dir / "demo_round_hybrid_debug.json").read_text(encoding="utf-8"))
+
+    def test_concurrent_model_fits_match_serial_and_report_critical_path(self) -> None:
+        rng = np.random.default_rng(71)
+        x = rng.random((14, 3))
+        y = np.sin(3.0 * x[:, 0]) + x[:, 1] * x[:, 2]
+        probe = rng.random((5, 3))
+
+        serial = bo_core.fit_hybrid_models(x, y, seed=9, gp_restarts=1)
+        concurrent = bo_core.fit_hybrid_models(x, y, seed=9, gp_restarts=1, fit_workers=4)
+
+        np.testing.assert_array_equal(serial.gp.kernel_.theta, concurrent.gp.kernel_.theta)
+        np.testing.assert_array_equal(serial.mlp.predict(probe), concurrent.mlp.predict(probe))
+        np.testing.assert_array_equal(serial.svc.predict_proba(probe), concurrent.svc.predict_proba(probe))
+        self.assertEqual(serial.regression_metrics, concurrent.regression_metrics)
+        self.assertEqual(concurrent.timings["fit_workers"], 4)
+        self.assertEqual(set(concurrent.timings["fit_tasks"]), {"gp", "mlp", "classifiers", "regression_cv"})
+        self.assertEqual(len(concurrent.timings["fit_critical_path"]), 1)
+
+        results, timings = bo_core.run_task_graph(
+            [
+                bo_core.FitTask("a", lambda: 2),
+                bo_core.FitTask("b", lambda: 3),
+                bo_core.FitTask("c", lambda a, b: a * b, deps=("a", "b")),
+            ],
+            workers=2,
+        )
+        self.assertEqual(results["c"], 6)
+        self.assertEqual(timings["fit_critical_path"][-1], "c")
+        with self.assertRaises(ValueError):
+            bo_core.run_task_graph([bo_core.FitTask("c", lambda a: a, deps=("a",))])
+
+    def test_mlp_ensemble_stacked_pass_matches_members_and_is_cached(self) -> None:
+        rng = np.random.default_rng(79)
+        x = rng.random((16, 3))
+        y = np.sin(3.0 * x[:, 0]) + x[:, 1] - x[:, 2] ** 2
+        probe = rng.random((7, 3))
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cache = bo_core.SurrogateCache(Path(tmp_dir))
+            ensemble = bo_core.fit_mlp_ensemble(x, y, seed=4, n_members=3, cache=cache, workers=2)
+            expected = np.stack([member.predict(probe) for member in ensemble.members])
+            np.testing.assert_allclose(ensemble.member_predictions(probe), expected, atol=1e-10)
+            mean, spread = ensemble.mean_and_spread(probe)
+            np.testing.assert_allclose(mean, expected.mean(axis=0), atol=1e-10)
+            self.assertTrue(np.all(spread > 0.0))
+
+            misses = cache.misses
+            grown = bo_core.fit_mlp_ensemble(x, y, seed=4, n_members=4, cache=cache, workers=1)
+            self.assertEqual(cache.misses, misses + 1)
+            np.testing.assert_allclose(grown.member_predictions(probe)[:3], expected, atol=1e-10)
+
+        candidate, info = bo_core.choose_hybrid_candidate(
+            x=x,
+            y=y,
+            rng=np.random.default_rng(3),
+            low=bo_core.DEFAULT_LOW,
+            high=bo_core.DEFAULT_HIGH,
+            boundary_margin=0.035,
+            seed=11,
+            strategy="balanced",
+            kappa=1.96,
+            gp_restarts=1,
+            nn_ensemble=3,
+        )
+        self.assertEqual(info["nn_ensemble_size"], 3)
+        self.assertEqual(info["nn_ucb_kappa"], 1.96)
+        self.assertGreater(info["chosen_candidate_nn_spread"], 0.0)
+        self.assertEqual(candidate.shape[0], 3)
+
+    def test_deferred_regression_cv_completes_debug_json(self) -> None:
+        rng = np.random.default_rng(61)
+        x = rng.random((12, 3))
+        y = np.cos(2.0 * x.sum(axis=1))
+        serial = bo_core._evaluate_regression_models(x, y, seed=5)
+        parallel = bo_core._evaluate_regression_models(x, y, seed=5, workers=2)
+        self.assertEqual(serial, parallel)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            out_dir = Path(tmp_dir)
+            cache = bo_core.SurrogateCache(out_dir / "cache")
+            models = bo_core.fit_hybrid_models(x, y, seed=2, gp_restarts=1, cache=cache, defer_regression_cv=True)
+            info = dict(models.regression_metrics)
+            self.assertEqual(info["regression_cv_status"], "deferred")
+            self.assertIsNone(info["mlp_r2_cv_mean"])
+
+            debug_info = {"_config": {}, "function_1": info}
+            bo_core.write_submission_outputs(
+                out_dir,
+                {f"function_{i}": [0.5, 0.5, 0.5] for i in range(1, 9)},
+                {f"function_{i}": "0.500000-0.500000-0.500000" for i in range(1, 9)},
+                debug_info,
+                prefix="demo_round",
+                debug_label="hybrid_debug",
+            )
+            job_path = bo_core.write_regression_cv_job(
+                out_dir,
+                debug_info,
+                {"function_1": (x, y)},
+                prefix="demo_round",
+                debug_label="hybrid_debug",
+                cache=cache,
+            )
+            bo_core.complete_regression_cv_job(job_path)
+
+            self.assertFalse(job_path.exists())
+            completed = json.loads((out_dir / "demo_round_hybrid_debug.json").read_text(encoding="utf-8"))
+            self.assertEqual(completed["function_1"]["regression_cv_status"], "complete")
+            expected = bo_core._evaluate_regression_models(x, y, seed=info["regression_cv_seed"])
+            for key, value in expected.items():
+                self.assertEqual(completed["function_1"][key], value)
+
+            rerun = bo_core.fit_hybrid_models(x, y, seed=2, gp_restarts=1, cache=cache, defer_regression_cv=True)
+            self.assertEqual(rerun.regression_metrics, expected)
+
+            job_path = bo_core.write_regression_cv_job(
+                out_dir,
+                debug_info,
+                {"function_1": (x, y)},
+                prefix="demo_round",
+                debug_label="hybrid_debug",
+                cache=None,
+            )
+            with mock.patch.object(bo_core, "_evaluate_regression_models", side_effect=RuntimeError("boom")):
+                with self.assertRaises(RuntimeError):
+                    bo_core.complete_regression_cv_job(job_path)
+            self.assertTrue(job_path.exists())
+            failed = json.loads((out_dir / "demo_round_hybrid_debug.json").read_text(encoding="utf-8"))
+            self.assertEqual(failed["function_1"]["regression_cv_status"], "failed")
+            self.assertEqual(failed["function_1"]["regression_cv_error"], "RuntimeError: boom")
+
+            missing_job = out_dir / "missing_regression_cv_job.json"
+            bo_core.launch_regression_cv_job(missing_job).wait(timeout=60)
+            self.assertIn("FileNotFoundError", missing_job.with_suffix(".log").read_text(encoding="utf-8"))
+
+    def test_parallel_function_workers_write_identical_artifacts(self) -> None:
+        shared = bo_core.function_rngs(5, None)
+        self.assertTrue(all(rng is shared[0] for rng in shared))
+        spawned = bo_core.function_rngs(5, 3)
+        self.assertEqual(len({float(rng.random()) for rng in spawned}), len(bo_core.FUNCTION_IDS))
+
+        dims = [2, 2, 3, 4, 4, 5, 6, 8]
+        parser = bo_core.build_gp_candidate_parser(description="test", seed_default=17, output_prefix="round_test")
+        outputs = {}
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for workers in (1, 3):
+                data_root = Path(tmp_dir) / f"data_{workers}"
+                for func_id, dim in enumerate(dims, start=1):
+                    func_dir = data_root / f"function_{func_id}"
+                    func_dir.mkdir(parents=True)
+                    func_rng = np.random.default_rng(func_id)
+                    np.save(func_dir / "initial_inputs.npy", func_rng.random((10, dim)))
+                    np.save(func_dir / "initial_outputs.npy", func_rng.random(10))
+                out_dir = Path(tmp_dir) / f"out_{workers}"
+                args = parser.parse_args(
+                    ["--data-root", str(data_root), "--out-dir", str(out_dir), "--no-cache", "--workers", str(workers)]
+                )
+                bo_core.run_gp_candidate_script(args)
+                outputs[workers] = {
+                    path.name: path.read_bytes() for path in sorted(out_dir.iterdir()) if "timings" not in path.name
+                }
+                outputs[workers]["gp_state"] = (data_root / "function_8" / bo_core.GP_STATE_FILENAME).read_bytes()
+
+        self.assertEqual(outputs[1], outputs[3])
+
+    def test_skip_ingest_rerun_hits_surrogate_cache(self) -> None:
+        dims = [2, 2, 3, 4, 4, 5, 6, 8]
+        parser = bo_core.build_round_candidate_parser(
+            description="test",
+            inputs_default=REPO_ROOT / "deliverables" / "submissions" / "round_06_inputs_batched.txt",
+            outputs_default=REPO_ROOT / "deliverables" / "submissions" / "round_06_outputs.txt",
+            seed_default=19,
+            prefix_default="round_test",
+        )
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            data_root = Path(tmp_dir) / "data"
+            for func_id, dim in enumerate(dims, start=1):
+                func_dir = data_root / f"function_{func_id}"
+                func_dir.mkdir(parents=True)
+                func_rng = np.random.default_rng(func_id)
+                np.save(func_dir / "initial_inputs.npy", func_rng.random((10, dim)))
+                np.save(func_dir / "initial_outputs.npy", func_rng.random(10))
+            args = parser.parse_args(
+                ["--skip-ingest", "--data-root", str(data_root), "--out-dir", str(Path(tmp_dir) / "out")]
+                + ["--cache-dir", str(Path(tmp_dir) / "cache"), "--nn-ensemble", "2"]
+            )
+            runs = []
+            for _ in range(3):
+                cache = bo_core.surrogate_cache_from_args(args)
+                with mock.patch.object(bo_core, "surrogate_cache_from_args", return_value=cache):
+                    bo_core.run_round_candidate_script(args, snapshot_filename="unused.txt")
+                runs.append(cache)
+                warm_start = bo_core.load_gp_warm_start(data_root / "function_3")
+                self.assertIsNone(warm_start["source"])
+
+        self.assertGreater(runs[0].misses, 0)
+        self.assertEqual([cache.misses for cache in runs[1:]], [0, 0])
+        self.assertGreater(runs[1].hits, 0)
 
     def test_wrappers_delegate_to_shared_runner(self) -> None:
         with mock.patch.object(propose_gp_candidates, "run_gp_candidate_script") as gp_runner: